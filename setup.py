@@ -12,8 +12,8 @@ from pathlib import Path
 
 def check_python_version():
     """Check if Python version is compatible."""
-    if sys.version_info < (3, 7):
-        print("❌ Error: Python 3.7 or higher is required")
+    if sys.version_info < (3, 8):
+        print("❌ Error: Python 3.8 or higher is required")
         print(f"Current version: {sys.version}")
         return False
     print(f"✅ Python version: {sys.version.split()[0]}")
@@ -77,7 +77,6 @@ def test_installation():
     try:
         # Test imports
         import azure.cognitiveservices.speech as speechsdk
-        from moviepy.editor import VideoFileClip
         from dotenv import load_dotenv
         print("✅ All required packages imported successfully")
 
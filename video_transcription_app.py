@@ -1,23 +1,51 @@
+import io
 import os
+import re
 import sys
 import tempfile
 import logging
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+from dataclasses import dataclass
 import time
 import shutil
-
-# Required libraries - install with: pip install moviepy azure-cognitiveservices-speech python-dotenv
+import subprocess
+import threading
+import queue
+import uuid
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, unquote
+
+# Required libraries - install with: pip install azure-cognitiveservices-speech python-dotenv
+# Audio extraction shells out to the ffmpeg binary, which must be on PATH.
 try:
-    from moviepy.editor import VideoFileClip, AudioFileClip
     import azure.cognitiveservices.speech as speechsdk
     from dotenv import load_dotenv
 except ImportError as e:
     print(f"Missing required library: {e}")
     print("Please install required libraries:")
-    print("pip install moviepy azure-cognitiveservices-speech python-dotenv")
+    print("pip install azure-cognitiveservices-speech python-dotenv")
     sys.exit(1)
 
+# Optional: faster parsing of recognition result JSON - install with: pip install orjson
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Optional: Speech auth tokens and the Batch Transcription API - install with: pip install requests
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Optional: Azure Batch Transcription in batch mode - install with: pip install azure-storage-blob
+try:
+    from azure.storage.blob import ContainerClient
+except ImportError:
+    ContainerClient = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,12 +57,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# silencedetect log lines, e.g. "silence_start: 12.5" / "silence_end: 13.2 | silence_duration: 0.7"
+SILENCE_PATTERN = re.compile(r'silence_(start|end): (-?\d+(?:\.\d+)?)')
+
+# Output file layouts, each rendered with str.format and written in one call
+TRANSCRIPT_TEMPLATE = (
+    "Transcription Results\n"
+    "==================================================\n\n"
+    "Source File: {result.input_file}\n"
+    "File Size: {result.file_size_mb} MB\n"
+    "Language: {result.language}\n"
+    "Confidence Score: {result.confidence_score}\n"
+    "Processing Time: {result.processing_time_seconds} seconds\n"
+    "Timestamp: {result.timestamp}\n\n"
+    "Transcription:\n"
+    "==============================\n"
+    "{result.transcription}\n"
+)
+
+TEST_TRANSCRIPT_TEMPLATE = (
+    "--- TEST TRANSCRIPTION (First 60 seconds) ---\n"
+    "Source File: {result.input_file}\n"
+    "Language: {result.language}\n"
+    "Confidence: {result.confidence_score}\n"
+    "Processing Time: {result.processing_time_seconds}s\n\n"
+    "Transcription:\n"
+    "==============================\n"
+    "{result.transcription}\n"
+)
+
+BATCH_SUMMARY_TEMPLATE = (
+    "Batch Transcription Summary\n"
+    "==================================================\n\n"
+    "Total files processed: {total}\n"
+    "Successful: {successful}\n"
+    "Failed: {failed}\n"
+    "Language: {language}\n"
+    "Timestamp: {timestamp}\n\n"
+)
+
+# slots=True (Python 3.10+) drops the per-instance __dict__ of each result
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class TranscriptionResult:
+    """Outcome of transcribing one input file; `error` is set when it failed."""
+    input_file: str
+    file_type: str = ''
+    file_size_mb: float = 0.0
+    transcription: str = ''
+    confidence_score: float = 0.0
+    language: str = ''
+    processing_time_seconds: float = 0.0
+    timestamp: str = ''
+    audio_file: Optional[str] = None
+    transcript_file: Optional[str] = None
+    error: Optional[str] = None
+
+
+class PcmPullCallback(speechsdk.audio.PullAudioInputStreamCallback):
+    """
+    Pull-stream callback feeding a recognizer from binary streams, such as ffmpeg
+    stdout pipes, read one after another. The recognizer reads only as fast as it
+    recognizes, so ffmpeg blocks on a full pipe instead of the SDK buffering the
+    whole decoded file in memory. Each stream read to its end is reported on
+    `exhausted` as (stream, bytes read).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.exhausted = queue.Queue()
+        self._sources = queue.Queue()
+        self._current = None
+        self._read = 0
+
+    def add(self, source):
+        """Queues a binary stream to be read after those already added."""
+        self._sources.put(source)
+
+    def finish(self):
+        """Ends the audio once the added streams are exhausted."""
+        self._sources.put(None)
+
+    def read(self, buffer: memoryview) -> int:
+        while True:
+            if self._current is None:
+                self._current = self._sources.get()
+                if self._current is None:
+                    # Keep the end marker for any later read
+                    self._sources.put(None)
+                    return 0
+                self._read = 0
+            data = self._current.read(buffer.nbytes)
+            if data:
+                buffer[:len(data)] = data
+                self._read += len(data)
+                return len(data)
+            self.exhausted.put((self._current, self._read))
+            self._current = None
+
+    def close(self):
+        pass
+
+
 class VideoTranscriptionApp:
     """
     A complete application for extracting audio from video files and 
     transcribing them using Azure Speech Services.
     """
 
+    # ffmpeg output options for Azure Speech's preferred 16kHz, 16-bit, mono PCM
+    WAV_FFMPEG_PARAMS = ('-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1')
+
     def __init__(self, azure_key: str, azure_region: str):
         """
         Initialize the transcription application.
@@ -45,11 +180,65 @@ class VideoTranscriptionApp:
         """
         self.azure_key = azure_key
         self.azure_region = azure_region
-        self.supported_video_formats = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v']
-        self.supported_audio_formats = ['.wav', '.mp3', '.ogg', '.flac', '.m4a']
-        self.temp_dir = tempfile.mkdtemp(prefix='video_transcription_')
+        self.supported_video_formats = frozenset(('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'))
+        self.supported_audio_formats = frozenset(('.wav', '.mp3', '.ogg', '.flac', '.m4a'))
+        # Files transcribed concurrently in batch mode; keep this within the
+        # Speech resource's real-time concurrency limit.
+        try:
+            self.max_workers = max(1, int(os.getenv('MAX_CONCURRENT_TRANSCRIPTIONS', '4')))
+        except ValueError:
+            logger.warning(f"MAX_CONCURRENT_TRANSCRIPTIONS must be an integer, got "
+                           f"{os.getenv('MAX_CONCURRENT_TRANSCRIPTIONS')!r}; using 4")
+            self.max_workers = 4
+        # Caps running recognizers at max_workers across all pools, since chunks of
+        # long files are recognized in pools nested inside the batch workers
+        self._recognizer_slots = threading.BoundedSemaphore(self.max_workers)
+        # A recognizer shared by consecutive batch files is recycled after this many
+        # files or seconds of audio, since latency grows on long-lived connections.
+        self.recognizer_max_files = 20
+        self.recognizer_max_audio_seconds = 300
+        # Longer media is split at silences into chunks of at most this length,
+        # recognized in parallel, since one recognizer runs at most at real time.
+        self.chunk_max_seconds = 300
+        # No chunk is cut shorter than this, so a cut never leaves a sliver of audio
+        self.chunk_min_seconds = 30
+        # Blob container SAS URL (read/write/delete) used to stage media for the
+        # Batch Transcription API; without it batch mode uses real-time recognition.
+        self.blob_container_url = os.getenv('AZURE_STORAGE_CONTAINER_SAS_URL')
+        self.batch_api_audio_formats = frozenset(('.wav', '.mp3', '.ogg', '.flac'))
+        self.batch_api_url = f"https://{azure_region}.api.cognitive.microsoft.com/speechtotext/v3.1/transcriptions"
+        # Seconds to wait on each Batch Transcription API request before giving up
+        self.http_timeout = 30
+        # A batch job still unfinished after this many seconds fails its files
+        self.batch_max_wait_seconds = 4 * 60 * 60
+        self.temp_dir = tempfile.mkdtemp(prefix='video_transcription_', dir=self._temp_base_dir())
+        # SpeechConfig per recognition language, shared by batch worker threads
+        self._config_cache = {}
+        self._config_lock = threading.Lock()
+        # Short-lived auth token issued from the key, refreshed in the background
+        self.token_url = f"https://{azure_region}.api.cognitive.microsoft.com/sts/v1.0/issueToken"
+        self._auth_token = None
+        self._token_timer = None
+        self._token_unavailable = False
+        # Recognizers currently running, which are handed each refreshed token
+        self._live_recognizers = set()
         logger.info(f"Temporary directory created: {self.temp_dir}")
 
+    @staticmethod
+    def _temp_base_dir():
+        """
+        Returns /dev/shm when it is available with enough free space, so extracted
+        audio stays in memory-backed tmpfs; None selects the default temp dir.
+        """
+        shm = '/dev/shm'
+        try:
+            # An hour of 16kHz mono PCM is ~115 MB; keep ample headroom so RAM isn't exhausted
+            if os.path.isdir(shm) and os.access(shm, os.W_OK) and shutil.disk_usage(shm).free > 2 * 1024 ** 3:
+                return shm
+        except OSError:
+            pass
+        return None
+
     def extract_audio_from_video(self, video_path: str, output_format: str = 'wav') -> str:
         """
         Extract audio from video file and convert to a format compatible with Azure Speech.
@@ -71,29 +260,18 @@ class VideoTranscriptionApp:
 
             logger.info(f"Extracting audio from: {video_path}")
 
-            # Load video file
-            video_clip = VideoFileClip(str(video_path))
-
-            # Extract audio
-            audio_clip = video_clip.audio
-
-            # Generate output filename
-            audio_filename = f"{video_path.stem}_audio.{output_format}"
-            audio_path = os.path.join(self.temp_dir, audio_filename)
+            # Generate output filename; the suffix keeps videos sharing a stem (a.mp4,
+            # a.mkv) that are extracted concurrently from writing the same file
+            audio_filename = f"{video_path.stem}_{uuid.uuid4().hex[:8]}_audio.{output_format}"
+            audio_path = str(Path(self.temp_dir) / audio_filename)
 
             # Write audio file with settings optimized for Azure Speech
             # Azure Speech works best with 16kHz, 16-bit, mono WAV
-            audio_clip.write_audiofile(
-                audio_path,
-                codec='pcm_s16le' if output_format == 'wav' else None,
-                ffmpeg_params=['-ar', '16000', '-ac', '1'] if output_format == 'wav' else None,
-                verbose=False,
-                logger=None
-            )
-
-            # Clean up
-            audio_clip.close()
-            video_clip.close()
+            argv = ['ffmpeg', '-nostdin', '-y', '-loglevel', 'error', '-i', str(video_path), '-vn']
+            if output_format == 'wav':
+                argv += self._audio_codec_params(self._probe_media(video_path))
+            argv.append(audio_path)
+            self._run_ffmpeg(argv)
 
             logger.info(f"Audio extracted successfully: {audio_path}")
             return audio_path
@@ -102,65 +280,356 @@ class VideoTranscriptionApp:
             logger.error(f"Error extracting audio: {str(e)}")
             raise
 
+    def _run_ffmpeg(self, argv: list):
+        """Runs an ffmpeg command, raising RuntimeError with its stderr on failure."""
+        result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='replace').strip()}")
+
     def transcribe_audio(self, audio_path: str, language: str = "en-US") -> Tuple[str, float]:
         """
-        Transcribe audio file using Azure Speech Service.
+        Transcribe audio file using Azure Speech Service. Files longer than
+        chunk_max_seconds are split at silences and recognized in parallel.
         """
         try:
             logger.info(f"Starting transcription of: {audio_path}")
-            speech_config = speechsdk.SpeechConfig(subscription=self.azure_key, region=self.azure_region)
-            speech_config.speech_recognition_language = language
-            audio_input = speechsdk.AudioConfig(filename=audio_path)
-            speech_recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config, audio_config=audio_input)
-
-            transcription_text = ""
-            done = False
-            confidence_scores = []
-
-            def session_started_callback(evt):
-                logger.info(f"Recognition session started: {evt}")
-
-            def session_stopped_callback(evt):
-                nonlocal done
-                logger.info(f"Recognition session stopped: {evt}")
-                done = True
-
-            def recognized_callback(evt):
-                nonlocal transcription_text
-                if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
-                    transcription_text += evt.result.text + " "
-                    confidence_scores.append(evt.result.json.get('NBest', [{}])[0].get('Confidence', 0))
-                    logger.debug(f"Recognized: {evt.result.text}")
-                elif evt.result.reason == speechsdk.ResultReason.NoMatch:
-                    logger.warning("No speech could be recognized from the audio.")
-
-            def canceled_callback(evt):
-                nonlocal done
-                logger.error(f"Recognition canceled: {evt.reason}")
-                if evt.reason == speechsdk.CancellationReason.Error:
-                    logger.error(f"Error details: {evt.error_details}")
-                done = True
-
-            speech_recognizer.recognized.connect(recognized_callback)
-            speech_recognizer.session_started.connect(session_started_callback)
-            speech_recognizer.session_stopped.connect(session_stopped_callback)
-            speech_recognizer.canceled.connect(canceled_callback)
+            probe = self._probe_media(audio_path)
+            if (probe.get('duration') or 0) > self.chunk_max_seconds:
+                transcription, confidence_scores = self._transcribe_chunked(audio_path, language, probe)
+            else:
+                audio_input = speechsdk.AudioConfig(filename=audio_path)
+                transcription, confidence_scores = self._recognize(audio_input, language)
+            return transcription, sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
 
-            speech_recognizer.start_continuous_recognition()
-            while not done:
-                time.sleep(0.5)
+        except Exception as e:
+            logger.error(f"Error during transcription: {str(e)}")
+            raise
 
-            speech_recognizer.stop_continuous_recognition()
+    def transcribe_media_stream(self, media_path: str, language: str = "en-US",
+                                duration: Optional[int] = None) -> Tuple[str, float]:
+        """
+        Transcribe a media file by piping ffmpeg's decoded PCM straight into
+        Azure Speech, so decoding overlaps recognition and no WAV is written.
 
-            avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
-            logger.info(f"Transcription completed. Text length: {len(transcription_text)} characters")
-            return transcription_text.strip(), avg_confidence
+        Args:
+            media_path: Path to the input video or audio file
+            language: Recognition language
+            duration: If set, only the first `duration` seconds are transcribed
+        """
+        try:
+            logger.info(f"Starting streamed transcription of: {media_path}")
+            probe = self._probe_media(media_path)
+            if duration is None and (probe.get('duration') or 0) > self.chunk_max_seconds:
+                transcription, confidence_scores = self._transcribe_chunked(media_path, language, probe)
+            else:
+                transcription, confidence_scores = self._stream_segment(
+                    media_path, language, self._audio_codec_params(probe), duration=duration
+                )
+            return transcription, sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
 
         except Exception as e:
             logger.error(f"Error during transcription: {str(e)}")
             raise
 
-    def process_file(self, file_path: str, language: str = "en-US", save_audio: bool = False) -> dict:
+    def _stream_segment(self, media_path, language: str, codec_params: tuple, start: float = 0,
+                        duration: Optional[float] = None) -> Tuple[str, list]:
+        """
+        Recognizes a media file, or a span of it, read by the recognizer from ffmpeg's
+        stdout. Returns the text and per-phrase confidence scores, as _recognize does.
+        """
+        proc = None
+        # ffmpeg's stderr goes to a file: a full stderr pipe would block it mid-stream
+        stderr_file = tempfile.TemporaryFile(dir=self.temp_dir)
+        try:
+            proc = subprocess.Popen(self._pcm_stream_argv(media_path, codec_params, duration, start),
+                                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file)
+            pull_callback = PcmPullCallback()
+            pull_callback.add(proc.stdout)
+            pull_callback.finish()
+
+            stream_format = speechsdk.audio.AudioStreamFormat(samples_per_second=16000, bits_per_sample=16, channels=1)
+            stream = speechsdk.audio.PullAudioInputStream(pull_stream_callback=pull_callback,
+                                                          stream_format=stream_format)
+            result = self._recognize(speechsdk.audio.AudioConfig(stream=stream), language)
+
+            if proc.wait() != 0:
+                raise RuntimeError(f"ffmpeg failed: {self._read_stderr(stderr_file)}")
+            return result
+
+        finally:
+            if proc is not None:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+            stderr_file.close()
+
+    @staticmethod
+    def _read_stderr(stderr_file) -> str:
+        """Returns the tail of an ffmpeg stderr log file, enough to show why it failed."""
+        size = stderr_file.seek(0, os.SEEK_END)
+        stderr_file.seek(max(0, size - 4096))
+        return stderr_file.read().decode(errors='replace').strip()
+
+    def _transcribe_chunked(self, media_path, language: str, probe: dict) -> Tuple[str, list]:
+        """
+        Splits long media at silences into chunks of at most chunk_max_seconds and
+        recognizes them concurrently, joining the transcripts in time order.
+        probe is the file's _probe_media result, shared by all chunks.
+
+        Returns:
+            The transcript and the confidence scores of all its phrases
+        """
+        chunks = self._plan_chunks(probe['duration'], self._find_silences(media_path))
+        logger.info(f"Transcribing {media_path} as {len(chunks)} parallel chunks")
+        codec_params = self._audio_codec_params(probe)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(self._stream_segment, media_path, language, codec_params, start, end - start)
+                for start, end in chunks
+            ]
+            chunk_results = [future.result() for future in futures]
+
+        transcription = " ".join(text for text, _ in chunk_results if text)
+        # Phrase scores are pooled, so chunks without speech don't lower the average
+        confidence_scores = [score for _, scores in chunk_results for score in scores]
+        return transcription, confidence_scores
+
+    def _probe_media(self, media_path) -> dict:
+        """
+        Probes a media file with a single ffprobe run. Returns codec_name, sample_rate
+        and channels of the first audio stream plus the duration in seconds; fields
+        ffprobe couldn't report are missing, and duration is None.
+        """
+        probe = {'duration': None}
+        try:
+            result = subprocess.run(
+                ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+                 '-show_entries', 'format=duration:stream=codec_name,sample_rate,channels',
+                 '-of', 'json', str(media_path)],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            info = json_loads(result.stdout)
+            probe.update((info.get('streams') or [{}])[0])
+            probe['duration'] = float(info.get('format', {}).get('duration'))
+        except (OSError, ValueError, AttributeError, TypeError):
+            pass
+        return probe
+
+    def _find_silences(self, media_path) -> list:
+        """Returns the midpoints, in seconds, of silences found by ffmpeg's silencedetect filter."""
+        result = subprocess.run(
+            ['ffmpeg', '-nostdin', '-hide_banner', '-nostats', '-i', str(media_path), '-vn',
+             '-af', 'silencedetect=n=-30dB:d=0.5', '-f', 'null', '-'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg silence detection failed for {media_path}")
+
+        midpoints = []
+        silence_start = None
+        for kind, seconds in SILENCE_PATTERN.findall(result.stderr.decode(errors='replace')):
+            if kind == 'start':
+                silence_start = float(seconds)
+            elif silence_start is not None:
+                midpoints.append((silence_start + float(seconds)) / 2)
+                silence_start = None
+        return midpoints
+
+    def _plan_chunks(self, total_duration: float, silences: list) -> list:
+        """
+        Picks (start, end) spans between chunk_min_seconds and chunk_max_seconds long,
+        cutting at the latest silence inside each window, or hard at the window end
+        if there is none. Cuts leaving less than chunk_min_seconds on either side are
+        skipped, so no span is a near-empty sliver.
+        """
+        bounds = [0.0]
+        while total_duration - bounds[-1] > self.chunk_max_seconds:
+            earliest = bounds[-1] + self.chunk_min_seconds
+            limit = min(bounds[-1] + self.chunk_max_seconds, total_duration - self.chunk_min_seconds)
+            candidates = [t for t in silences if earliest <= t <= limit]
+            bounds.append(candidates[-1] if candidates else limit)
+        bounds.append(total_duration)
+        return list(zip(bounds, bounds[1:]))
+
+    def _pcm_stream_argv(self, media_path, codec_params: tuple, duration: Optional[float] = None,
+                         start: float = 0) -> list:
+        """
+        Builds the ffmpeg command that decodes media to raw 16kHz mono PCM on stdout,
+        using the codec params from _audio_codec_params for the file.
+        """
+        argv = ['ffmpeg', '-nostdin', '-loglevel', 'error']
+        if duration is not None:
+            # -ss/-t before -i seek on the input, so only the span is decoded
+            argv += ['-ss', str(start), '-t', str(duration)]
+        argv += ['-i', str(media_path), '-vn', *codec_params, '-f', 's16le', 'pipe:1']
+        return argv
+
+    def _audio_codec_params(self, probe: dict) -> tuple:
+        """
+        Returns ffmpeg output options producing 16kHz mono PCM from a _probe_media
+        result: a stream copy when the source audio already is, so it isn't decoded
+        and resampled needlessly. The probed first audio track is mapped explicitly,
+        since ffmpeg would otherwise pick the track with the most channels.
+        """
+        if (probe.get('codec_name') == 'pcm_s16le'
+                and str(probe.get('sample_rate')) == '16000'
+                and probe.get('channels') == 1):
+            return ('-map', '0:a:0', '-acodec', 'copy')
+        return ('-map', '0:a:0', *self.WAV_FFMPEG_PARAMS)
+
+    def _speech_config(self, language: str):
+        """Returns the cached SpeechConfig for a language, creating it on first use."""
+        with self._config_lock:
+            speech_config = self._config_cache.get(language)
+            if speech_config is None:
+                auth_token = self._current_auth_token()
+                if auth_token is not None:
+                    speech_config = speechsdk.SpeechConfig(auth_token=auth_token, region=self.azure_region)
+                else:
+                    speech_config = speechsdk.SpeechConfig(subscription=self.azure_key, region=self.azure_region)
+                speech_config.speech_recognition_language = language
+                # Detailed output carries the NBest list with per-phrase confidence
+                speech_config.output_format = speechsdk.OutputFormat.Detailed
+                self._config_cache[language] = speech_config
+            return speech_config
+
+    def _current_auth_token(self) -> Optional[str]:
+        """
+        Returns the auth token, issuing one and scheduling its refresh on first use.
+        None means the subscription key should be used instead. Caller holds _config_lock.
+        """
+        if self._auth_token is None and not self._token_unavailable:
+            self._auth_token = self._issue_auth_token()
+            if self._auth_token is None:
+                self._token_unavailable = True
+            else:
+                self._schedule_token_refresh()
+        return self._auth_token
+
+    def _issue_auth_token(self) -> Optional[str]:
+        """Exchanges the subscription key for a 10-minute auth token, or returns None."""
+        if requests is None:
+            return None
+        try:
+            response = requests.post(self.token_url, headers={'Ocp-Apim-Subscription-Key': self.azure_key}, timeout=10)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            logger.warning(f"Could not issue Speech auth token, using subscription key: {str(e)}")
+            return None
+
+    def _schedule_token_refresh(self):
+        """Refreshes the token after 9 minutes, a minute before it expires."""
+        self._token_timer = threading.Timer(9 * 60, self._refresh_auth_token)
+        self._token_timer.daemon = True
+        self._token_timer.start()
+
+    def _refresh_auth_token(self):
+        """Re-issues the auth token and hands it to the cached configs and running recognizers."""
+        auth_token = self._issue_auth_token()
+        with self._config_lock:
+            if auth_token is None:
+                # Configs holding the expiring token are dropped and rebuilt from the key
+                self._auth_token = None
+                self._token_unavailable = True
+                self._config_cache.clear()
+                return
+
+            self._auth_token = auth_token
+            for speech_config in self._config_cache.values():
+                speech_config.authorization_token = auth_token
+            # A recognizer copies its config when created, so running sessions need the token too
+            for speech_recognizer in self._live_recognizers:
+                speech_recognizer.authorization_token = auth_token
+            self._schedule_token_refresh()
+
+    def _create_recognizer(self, language: str, audio_config):
+        """
+        Creates a recognizer and registers it to receive refreshed auth tokens until
+        released. Blocks while max_workers recognizers are already running.
+        """
+        self._recognizer_slots.acquire()
+        try:
+            speech_recognizer = speechsdk.SpeechRecognizer(speech_config=self._speech_config(language),
+                                                           audio_config=audio_config)
+        except Exception:
+            self._recognizer_slots.release()
+            raise
+        with self._config_lock:
+            # The token may have been refreshed since the config was handed out
+            if self._auth_token is not None:
+                speech_recognizer.authorization_token = self._auth_token
+            self._live_recognizers.add(speech_recognizer)
+        return speech_recognizer
+
+    def _release_recognizer(self, speech_recognizer):
+        """Stops handing refreshed auth tokens to a finished recognizer and frees its slot."""
+        with self._config_lock:
+            self._live_recognizers.discard(speech_recognizer)
+        self._recognizer_slots.release()
+
+    def _recognize(self, audio_input, language: str) -> Tuple[str, list]:
+        """
+        Runs continuous recognition over an audio config and returns the text and the
+        confidence score of each recognized phrase, which callers average.
+        Raises RuntimeError if recognition is canceled by an error, so partial text
+        isn't reported as a complete transcript.
+        """
+        speech_recognizer = self._create_recognizer(language, audio_input)
+
+        parts = []
+        cancel_error = None
+        done = threading.Event()
+        confidence_scores = []
+
+        def session_started_callback(evt):
+            logger.info(f"Recognition session started: {evt}")
+
+        def session_stopped_callback(evt):
+            logger.info(f"Recognition session stopped: {evt}")
+            done.set()
+
+        def recognized_callback(evt):
+            if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
+                parts.append(evt.result.text)
+                # result.json is a JSON string, not a dict
+                nbest = json_loads(evt.result.json).get('NBest') or [{}]
+                confidence_scores.append(nbest[0].get('Confidence', 0.0))
+                logger.debug(f"Recognized: {evt.result.text}")
+            elif evt.result.reason == speechsdk.ResultReason.NoMatch:
+                logger.warning("No speech could be recognized from the audio.")
+
+        def canceled_callback(evt):
+            nonlocal cancel_error
+            logger.error(f"Recognition canceled: {evt.reason}")
+            if evt.reason == speechsdk.CancellationReason.Error:
+                logger.error(f"Error details: {evt.error_details}")
+                cancel_error = evt.error_details
+            done.set()
+
+        speech_recognizer.recognized.connect(recognized_callback)
+        speech_recognizer.session_started.connect(session_started_callback)
+        speech_recognizer.session_stopped.connect(session_stopped_callback)
+        speech_recognizer.canceled.connect(canceled_callback)
+
+        try:
+            speech_recognizer.start_continuous_recognition()
+            done.wait()
+
+            speech_recognizer.stop_continuous_recognition()
+        finally:
+            self._release_recognizer(speech_recognizer)
+
+        if cancel_error is not None:
+            raise RuntimeError(f"Recognition canceled: {cancel_error}")
+
+        transcription_text = " ".join(parts)
+        logger.info(f"Transcription completed. Text length: {len(transcription_text)} characters")
+        return transcription_text, confidence_scores
+
+    def process_file(self, file_path: str, language: str = "en-US", save_audio: bool = False) -> TranscriptionResult:
         """
         Complete pipeline: process a video or audio file and transcribe it.
         """
@@ -169,9 +638,10 @@ class VideoTranscriptionApp:
             raise FileNotFoundError(f"Input file not found: {file_path}")
 
         file_type = ""
-        if file_path_obj.suffix.lower() in self.supported_video_formats:
+        suffix = file_path_obj.suffix.lower()
+        if suffix in self.supported_video_formats:
             file_type = "video"
-        elif file_path_obj.suffix.lower() in self.supported_audio_formats:
+        elif suffix in self.supported_audio_formats:
             file_type = "audio"
         else:
             raise ValueError(f"Unsupported file format: {file_path_obj.suffix}")
@@ -181,7 +651,7 @@ class VideoTranscriptionApp:
         else: # audio
             return self.process_audio(file_path, language)
 
-    def process_audio(self, audio_path: str, language: str = "en-US") -> dict:
+    def process_audio(self, audio_path: str, language: str = "en-US") -> TranscriptionResult:
         """
         Complete pipeline for an audio file: transcribe it.
         """
@@ -192,26 +662,26 @@ class VideoTranscriptionApp:
             # Transcribe audio
             transcription, confidence = self.transcribe_audio(audio_path, language)
 
-            results = {
-                'input_file': str(audio_file.absolute()),
-                'file_type': 'audio',
-                'file_size_mb': round(audio_file.stat().st_size / (1024 * 1024), 2),
-                'transcription': transcription,
-                'confidence_score': round(confidence, 4),
-                'language': language,
-                'processing_time_seconds': round(time.time() - start_time, 2),
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
+            result = TranscriptionResult(
+                input_file=str(audio_file.absolute()),
+                file_type='audio',
+                file_size_mb=round(audio_file.stat().st_size / (1024 * 1024), 2),
+                transcription=transcription,
+                confidence_score=round(confidence, 4),
+                language=language,
+                processing_time_seconds=round(time.time() - start_time, 2),
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+            )
 
-            self._save_transcription_file(results)
-            logger.info(f"Processing completed successfully in {results['processing_time_seconds']} seconds")
-            return results
+            self._save_transcription_file(result)
+            logger.info(f"Processing completed successfully in {result.processing_time_seconds} seconds")
+            return result
 
         except Exception as e:
             logger.error(f"Error processing audio: {str(e)}")
             raise
 
-    def process_video(self, video_path: str, language: str = "en-US", save_audio: bool = False) -> dict:
+    def process_video(self, video_path: str, language: str = "en-US", save_audio: bool = False) -> TranscriptionResult:
         """
         Complete pipeline for a video file: extract audio and transcribe it.
         """
@@ -219,141 +689,83 @@ class VideoTranscriptionApp:
             start_time = time.time()
             video_file = Path(video_path)
 
-            # Extract audio
-            audio_path = self.extract_audio_from_video(video_path)
-
-            # Transcribe audio
-            transcription, confidence = self.transcribe_audio(audio_path, language)
-
-            audio_file = Path(audio_path)
-            results = {
-                'input_file': str(video_file.absolute()),
-                'file_type': 'video',
-                'file_size_mb': round(video_file.stat().st_size / (1024 * 1024), 2),
-                'audio_file': str(audio_file.absolute()) if save_audio else None,
-                'transcription': transcription,
-                'confidence_score': round(confidence, 4),
-                'language': language,
-                'processing_time_seconds': round(time.time() - start_time, 2),
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-
-            self._save_transcription_file(results)
+            if save_audio:
+                # Extract audio to a file that is kept, then transcribe it
+                audio_path = self.extract_audio_from_video(video_path)
+                transcription, confidence = self.transcribe_audio(audio_path, language)
+            else:
+                # Stream decoded audio straight into the recognizer
+                audio_path = None
+                transcription, confidence = self.transcribe_media_stream(video_path, language)
+
+            result = TranscriptionResult(
+                input_file=str(video_file.absolute()),
+                file_type='video',
+                file_size_mb=round(video_file.stat().st_size / (1024 * 1024), 2),
+                audio_file=str(Path(audio_path).absolute()) if save_audio else None,
+                transcription=transcription,
+                confidence_score=round(confidence, 4),
+                language=language,
+                processing_time_seconds=round(time.time() - start_time, 2),
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+            )
 
-            # Clean up temporary audio file if not saving
-            if not save_audio and os.path.exists(audio_path):
-                os.remove(audio_path)
-                logger.info("Temporary audio file cleaned up")
+            self._save_transcription_file(result)
 
-            logger.info(f"Processing completed successfully in {results['processing_time_seconds']} seconds")
-            return results
+            logger.info(f"Processing completed successfully in {result.processing_time_seconds} seconds")
+            return result
 
         except Exception as e:
             logger.error(f"Error processing video: {str(e)}")
             raise
 
-    def _save_transcription_file(self, results: dict):
+    def _save_transcription_file(self, result: TranscriptionResult):
         """Saves the transcription results to a text file."""
-        input_file = Path(results['input_file'])
+        input_file = Path(result.input_file)
         transcript_filename = f"{input_file.stem}_transcript.txt"
         transcript_path = input_file.parent / transcript_filename
 
-        with open(transcript_path, 'w', encoding='utf-8') as f:
-            f.write(f"Transcription Results\n")
-            f.write(f"{'=' * 50}\n\n")
-            f.write(f"Source File: {results['input_file']}\n")
-            f.write(f"File Size: {results['file_size_mb']} MB\n")
-            f.write(f"Language: {results['language']}\n")
-            f.write(f"Confidence Score: {results['confidence_score']}\n")
-            f.write(f"Processing Time: {results['processing_time_seconds']} seconds\n")
-            f.write(f"Timestamp: {results['timestamp']}\n\n")
-            f.write(f"Transcription:\n")
-            f.write(f"{'=' * 30}\n")
-            f.write(f"{results['transcription']}\n")
-
-        results['transcript_file'] = str(transcript_path)
-
-    def _create_test_audio_clip(self, media_path: str, duration: int = 60) -> str:
-        """Creates a temporary audio clip from the first part of a media file."""
-        try:
-            media_path = Path(media_path)
-            logger.info(f"Creating a {duration}-second test clip from: {media_path}")
-
-            if media_path.suffix.lower() in self.supported_video_formats:
-                clip = VideoFileClip(str(media_path))
-                audio_clip = clip.audio.subclip(0, min(duration, clip.audio.duration))
-            elif media_path.suffix.lower() in self.supported_audio_formats:
-                clip = AudioFileClip(str(media_path))
-                audio_clip = clip.subclip(0, min(duration, clip.duration))
-            else:
-                 raise ValueError(f"Unsupported file format for test clip: {media_path.suffix}")
-
-            test_audio_filename = f"{media_path.stem}_test_clip.wav"
-            test_audio_path = os.path.join(self.temp_dir, test_audio_filename)
-
-            audio_clip.write_audiofile(
-                test_audio_path,
-                codec='pcm_s16le',
-                ffmpeg_params=['-ar', '16000', '-ac', '1'],
-                verbose=False,
-                logger=None
-            )
-
-            clip.close()
-            audio_clip.close()
+        transcript_path.write_text(TRANSCRIPT_TEMPLATE.format(result=result), encoding='utf-8')
 
-            logger.info(f"Test audio clip created successfully: {test_audio_path}")
-            return test_audio_path
+        result.transcript_file = str(transcript_path)
 
-        except Exception as e:
-            logger.error(f"Error creating test audio clip: {str(e)}")
-            raise
-
-    def process_file_test(self, file_path: str, language: str = "en-US") -> dict:
+    def process_file_test(self, file_path: str, language: str = "en-US") -> TranscriptionResult:
         """
         Test pipeline: transcribes the first minute of a video or audio file.
         """
         try:
             start_time = time.time()
-            
-            # Create a 1-minute audio clip for testing
-            test_audio_path = self._create_test_audio_clip(file_path, duration=60)
-
-            # Transcribe the test audio clip
-            transcription, confidence = self.transcribe_audio(test_audio_path, language)
-
             input_file = Path(file_path)
-            results = {
-                'input_file': str(input_file.absolute()),
-                'file_type': 'test_clip',
-                'file_size_mb': round(input_file.stat().st_size / (1024 * 1024), 2),
-                'transcription': transcription,
-                'confidence_score': round(confidence, 4),
-                'language': language,
-                'processing_time_seconds': round(time.time() - start_time, 2),
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
+            if not input_file.exists():
+                raise FileNotFoundError(f"Input file not found: {file_path}")
+
+            suffix = input_file.suffix.lower()
+            if suffix not in self.supported_video_formats and suffix not in self.supported_audio_formats:
+                raise ValueError(f"Unsupported file format for test clip: {input_file.suffix}")
+
+            # Stream only the first minute into the recognizer; no clip is written to disk
+            transcription, confidence = self.transcribe_media_stream(file_path, language, duration=60)
+
+            result = TranscriptionResult(
+                input_file=str(input_file.absolute()),
+                file_type='test_clip',
+                file_size_mb=round(input_file.stat().st_size / (1024 * 1024), 2),
+                transcription=transcription,
+                confidence_score=round(confidence, 4),
+                language=language,
+                processing_time_seconds=round(time.time() - start_time, 2),
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+            )
 
             # Save transcription with a special name
             transcript_filename = f"{input_file.stem}_TEST_transcript.txt"
             transcript_path = input_file.parent / transcript_filename
-            results['transcript_file'] = str(transcript_path)
-
-            with open(transcript_path, 'w', encoding='utf-8') as f:
-                f.write(f"--- TEST TRANSCRIPTION (First 60 seconds) ---\n")
-                f.write(f"Source File: {results['input_file']}\n")
-                f.write(f"Language: {results['language']}\n")
-                f.write(f"Confidence: {results['confidence_score']}\n")
-                f.write(f"Processing Time: {results['processing_time_seconds']}s\n\n")
-                f.write(f"Transcription:\n{'='*30}\n{results['transcription']}\n")
-
-            # Clean up the temporary test audio file
-            if os.path.exists(test_audio_path):
-                os.remove(test_audio_path)
-                logger.info(f"Cleaned up temporary test clip: {test_audio_path}")
-
-            logger.info(f"Test processing completed successfully in {results['processing_time_seconds']} seconds")
-            return results
+            result.transcript_file = str(transcript_path)
+
+            transcript_path.write_text(TEST_TRANSCRIPT_TEMPLATE.format(result=result), encoding='utf-8')
+
+            logger.info(f"Test processing completed successfully in {result.processing_time_seconds} seconds")
+            return result
 
         except Exception as e:
             logger.error(f"Error during test processing: {str(e)}")
@@ -368,49 +780,42 @@ class VideoTranscriptionApp:
             if not media_dir.exists() or not media_dir.is_dir():
                 raise ValueError(f"Invalid directory: {media_directory}")
 
-            # Find all media files
-            media_files = []
-            supported_formats = self.supported_video_formats + self.supported_audio_formats
-            for ext in supported_formats:
-                media_files.extend(media_dir.glob(f"*{ext}"))
-                media_files.extend(media_dir.glob(f"*{ext.upper()}"))
+            # Find all media files in a single directory scan
+            suffixes = self.supported_video_formats | self.supported_audio_formats
+            with os.scandir(media_dir) as entries:
+                media_files = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in suffixes
+                )
 
             if not media_files:
                 logger.warning(f"No media files found in {media_directory}")
                 return []
 
-            logger.info(f"Found {len(media_files)} media files to process")
-
-            results = []
-            for i, media_file in enumerate(media_files, 1):
-                logger.info(f"Processing file {i}/{len(media_files)}: {media_file.name}")
-                try:
-                    result = self.process_file(str(media_file), language, save_audio)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to process {media_file.name}: {str(e)}")
-                    results.append({
-                        'input_file': str(media_file),
-                        'error': str(e),
-                        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
-                    })
+            if self._batch_api_enabled():
+                logger.info(f"Found {len(media_files)} media files to process with Azure Batch Transcription")
+                results = self._batch_transcribe(media_files, language, save_audio)
+            else:
+                logger.info(f"Found {len(media_files)} media files to process "
+                            f"with up to {self.max_workers} concurrent transcriptions")
+                results = self._realtime_transcribe(media_files, language, save_audio)
 
             # Create summary report
             summary_path = media_dir / f"batch_transcription_summary_{int(time.time())}.txt"
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(f"Batch Transcription Summary\n")
-                f.write(f"{'=' * 50}\n\n")
-                f.write(f"Total files processed: {len(media_files)}\n")
-                f.write(f"Successful: {len([r for r in results if 'error' not in r])}\n")
-                f.write(f"Failed: {len([r for r in results if 'error' in r])}\n")
-                f.write(f"Language: {language}\n")
-                f.write(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-                for result in results:
-                    if 'error' in result:
-                        f.write(f"❌ {Path(result['input_file']).name}: {result['error']}\n")
-                    else:
-                        f.write(f"✅ {Path(result['input_file']).name}: {len(result['transcription'])} chars\n")
+            failed = len([r for r in results if r.error is not None])
+            parts = [BATCH_SUMMARY_TEMPLATE.format(
+                total=len(media_files),
+                successful=len(results) - failed,
+                failed=failed,
+                language=language,
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+            )]
+            for result in results:
+                if result.error is not None:
+                    parts.append(f"❌ {Path(result.input_file).name}: {result.error}\n")
+                else:
+                    parts.append(f"✅ {Path(result.input_file).name}: {len(result.transcription)} chars\n")
+            summary_path.write_text("".join(parts), encoding='utf-8')
 
             logger.info(f"Batch processing completed. Summary saved to: {summary_path}")
             return results
@@ -419,18 +824,495 @@ class VideoTranscriptionApp:
             logger.error(f"Error in batch processing: {str(e)}")
             raise
 
+    def _realtime_transcribe(self, media_files: list, language: str, save_audio: bool) -> list:
+        """
+        Transcribes files concurrently with continuous recognition. Each worker
+        streams files back to back through a shared recognizer; when audio is
+        being kept, files are extracted and transcribed one per worker instead.
+        """
+        # Results are stored by input index so the summary keeps directory order
+        results = [None] * len(media_files)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            if not save_audio:
+                file_queue = queue.Queue()
+                for item in enumerate(media_files):
+                    file_queue.put(item)
+                workers = [
+                    pool.submit(self._shared_recognizer_worker, file_queue, language, results)
+                    for _ in range(min(self.max_workers, len(media_files)))
+                ]
+                for worker in workers:
+                    worker.result()
+                # Guard the summary against any file no session reported on
+                for i, media_file in enumerate(media_files):
+                    if results[i] is None:
+                        results[i] = self._error_result(media_file, "File was not transcribed")
+                return results
+
+            futures = {
+                pool.submit(self.process_file, str(media_file), language, save_audio): i
+                for i, media_file in enumerate(media_files)
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                media_file = media_files[i]
+                try:
+                    results[i] = future.result()
+                    logger.info(f"Processed file {completed}/{len(media_files)}: {media_file.name}")
+                except Exception as e:
+                    logger.error(f"Failed to process {media_file.name}: {str(e)}")
+                    results[i] = self._error_result(media_file, e)
+        return results
+
+    def _shared_recognizer_worker(self, file_queue: queue.Queue, language: str, results: list):
+        """
+        Runs shared-recognizer sessions until the file queue is drained. Each session
+        is handed its first file, so no recognizer is started once the queue is empty.
+        Files longer than chunk_max_seconds are split into parallel chunks instead,
+        so no session runs much past the recycle limits. A session that fails
+        outright fails only the files it had taken.
+        """
+        pending = None  # (input index, media file, probe) taken but not yet transcribed
+        while True:
+            if pending is None:
+                try:
+                    i, media_file = file_queue.get_nowait()
+                except queue.Empty:
+                    return
+                pending = (i, media_file, self._probe_media(media_file))
+            first, pending = pending, None
+            i, media_file, probe = first
+            claimed = [(i, media_file)]
+            try:
+                if (probe.get('duration') or 0) > self.chunk_max_seconds:
+                    results[i] = self._transcribe_chunked_file(media_file, language, probe)
+                else:
+                    pending = self._transcribe_shared_session(first, file_queue, language, results, claimed)
+            except Exception as e:
+                logger.error(f"Shared recognizer session failed: {str(e)}")
+                for i, media_file in claimed:
+                    if results[i] is None:
+                        results[i] = self._error_result(media_file, e)
+
+    def _transcribe_chunked_file(self, media_file: Path, language: str, probe: dict) -> TranscriptionResult:
+        """Transcribes a long batch file in parallel chunks rather than on a shared recognizer."""
+        start_time = time.time()
+        logger.info(f"Transcribing long file {media_file.name} in chunks")
+        transcription, confidence_scores = self._transcribe_chunked(media_file, language, probe)
+
+        result = TranscriptionResult(
+            input_file=str(media_file.absolute()),
+            file_type='video' if media_file.suffix.lower() in self.supported_video_formats else 'audio',
+            file_size_mb=round(media_file.stat().st_size / (1024 * 1024), 2),
+            transcription=transcription,
+            confidence_score=round(sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0, 4),
+            language=language,
+            processing_time_seconds=round(time.time() - start_time, 2),
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+        )
+        self._save_transcription_file(result)
+        logger.info(f"Processed file: {media_file.name}")
+        return result
+
+    def _transcribe_shared_session(self, first: tuple, file_queue: queue.Queue, language: str,
+                                   results: list, claimed: list) -> Optional[tuple]:
+        """
+        Transcribes the (input index, media file, probe) `first`, then further files
+        from the queue, back to back on one recognizer, so its connection is reused
+        instead of reopened per file. Each file's PCM is read into the same stream
+        followed by a second of silence, and recognized phrases are assigned to
+        files by their audio offset. The session ends once the recycle limits are
+        reached or the queue is empty. Each file taken from the queue is appended
+        to claimed.
+
+        Returns:
+            A dequeued file longer than chunk_max_seconds, which ended the session
+            untranscribed, or None
+        """
+        bytes_per_second = 32000  # 16 kHz, 16-bit, mono
+        silence = bytes(bytes_per_second)
+
+        pull_callback = PcmPullCallback()
+        stream_format = speechsdk.audio.AudioStreamFormat(samples_per_second=16000, bits_per_sample=16, channels=1)
+        stream = speechsdk.audio.PullAudioInputStream(pull_stream_callback=pull_callback, stream_format=stream_format)
+        speech_recognizer = self._create_recognizer(language, speechsdk.audio.AudioConfig(stream=stream))
+
+        phrases = []   # (offset in 100 ns ticks, text, confidence, time recognized)
+        segments = []  # (input index, media file, first byte, end byte, error, start time, time read)
+        session_error = None
+        done = threading.Event()
+
+        def recognized_callback(evt):
+            if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
+                nbest = json_loads(evt.result.json).get('NBest') or [{}]
+                phrases.append((evt.result.offset, evt.result.text, nbest[0].get('Confidence', 0.0), time.time()))
+
+        def session_stopped_callback(evt):
+            done.set()
+
+        def canceled_callback(evt):
+            nonlocal session_error
+            # Ending the stream cancels with EndOfStream; only errors fail the files
+            if evt.reason == speechsdk.CancellationReason.Error:
+                logger.error(f"Recognition canceled: {evt.error_details}")
+                session_error = f"Recognition canceled: {evt.error_details}"
+            done.set()
+
+        speech_recognizer.recognized.connect(recognized_callback)
+        speech_recognizer.session_stopped.connect(session_stopped_callback)
+        speech_recognizer.canceled.connect(canceled_callback)
+        try:
+            speech_recognizer.start_continuous_recognition()
+        except Exception:
+            self._release_recognizer(speech_recognizer)
+            raise
+
+        written = 0
+        item = first
+        deferred = None
+        try:
+            while True:
+                i, media_file, probe = item
+                logger.info(f"Streaming {media_file.name} into shared recognizer")
+                start_time = time.time()
+                first_byte = written
+                try:
+                    pushed, error = self._push_media(media_file, self._audio_codec_params(probe), pull_callback, done)
+                    written += pushed
+                except Exception as e:
+                    error = str(e)
+                pull_callback.add(io.BytesIO(silence))
+                written += len(silence)
+                segments.append((i, media_file, first_byte, written, error, start_time, time.time()))
+
+                if (len(segments) >= self.recognizer_max_files
+                        or written >= self.recognizer_max_audio_seconds * bytes_per_second
+                        or session_error is not None):
+                    break
+                try:
+                    i, media_file = file_queue.get_nowait()
+                except queue.Empty:
+                    break
+                claimed.append((i, media_file))
+                item = (i, media_file, self._probe_media(media_file))
+                if (item[2].get('duration') or 0) > self.chunk_max_seconds:
+                    # Streamed whole, a long file would hold this recognizer far past its limits
+                    deferred = item
+                    break
+        finally:
+            pull_callback.finish()
+            done.wait()
+            speech_recognizer.stop_continuous_recognition()
+            self._release_recognizer(speech_recognizer)
+
+        starts = [segment[2] for segment in segments]
+        texts = [[] for _ in segments]
+        confidence_scores = [[] for _ in segments]
+        # A file is done once its audio is read and its last phrase is recognized
+        end_times = [segment[6] for segment in segments]
+        for offset, text, confidence, recognized_at in phrases:
+            k = bisect_right(starts, offset * bytes_per_second // 10_000_000) - 1
+            if k >= 0:
+                texts[k].append(text)
+                confidence_scores[k].append(confidence)
+                end_times[k] = max(end_times[k], recognized_at)
+
+        for k, (i, media_file, _, _, error, start_time, _) in enumerate(segments):
+            error = error or session_error
+            if error:
+                logger.error(f"Failed to process {media_file.name}: {error}")
+                results[i] = self._error_result(media_file, error)
+                continue
+
+            try:
+                scores = confidence_scores[k]
+                result = TranscriptionResult(
+                    input_file=str(media_file.absolute()),
+                    file_type='video' if media_file.suffix.lower() in self.supported_video_formats else 'audio',
+                    file_size_mb=round(media_file.stat().st_size / (1024 * 1024), 2),
+                    transcription=" ".join(texts[k]),
+                    confidence_score=round(sum(scores) / len(scores) if scores else 0, 4),
+                    language=language,
+                    processing_time_seconds=round(end_times[k] - start_time, 2),
+                    timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+                )
+                self._save_transcription_file(result)
+                results[i] = result
+                logger.info(f"Processed file: {media_file.name}")
+            except Exception as e:
+                logger.error(f"Failed to process {media_file.name}: {str(e)}")
+                results[i] = self._error_result(media_file, e)
+
+        return deferred
+
+    def _push_media(self, media_file: Path, codec_params: tuple, pull_callback: PcmPullCallback,
+                    done: threading.Event) -> Tuple[int, Optional[str]]:
+        """
+        Decodes a media file with ffmpeg into a shared pull stream, without ending it,
+        and waits until the recognizer has read it or its session `done` is set.
+
+        Returns:
+            Number of PCM bytes read, and an error message if the file wasn't read through
+        """
+        with tempfile.TemporaryFile(dir=self.temp_dir) as stderr_file:
+            proc = subprocess.Popen(self._pcm_stream_argv(media_file, codec_params),
+                                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file)
+            written = None
+            try:
+                pull_callback.add(proc.stdout)
+                while written is None:
+                    try:
+                        source, read = pull_callback.exhausted.get(timeout=1)
+                    except queue.Empty:
+                        if done.is_set():
+                            return 0, "Recognition stopped before the file was read"
+                        continue
+                    # Earlier entries are the silence padding between files
+                    if source is proc.stdout:
+                        written = read
+                returncode = proc.wait()
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+            if returncode != 0:
+                return written, f"ffmpeg failed: {self._read_stderr(stderr_file)}"
+        return written, None
+
+    def _error_result(self, media_file: Path, error) -> TranscriptionResult:
+        """Builds the batch result entry for a file that could not be transcribed."""
+        return TranscriptionResult(
+            input_file=str(media_file),
+            error=str(error),
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+    def _batch_api_enabled(self) -> bool:
+        """Checks whether batch mode can use the Azure Batch Transcription API."""
+        if not self.blob_container_url:
+            return False
+        if requests is None or ContainerClient is None:
+            logger.warning("AZURE_STORAGE_CONTAINER_SAS_URL is set but requests/azure-storage-blob are not "
+                           "installed; falling back to real-time recognition")
+            return False
+        return True
+
+    def _batch_transcribe(self, media_files: list, language: str, save_audio: bool) -> list:
+        """
+        Transcribes files with a single Azure Batch Transcription job: each file is
+        staged in blob storage, all URLs are submitted together, and the per-file
+        transcripts are collected once the job finishes.
+        """
+        start_time = time.time()
+        container = ContainerClient.from_container_url(self.blob_container_url)
+        prefix = f"video_transcription_{int(start_time)}_{uuid.uuid4().hex[:8]}"
+        results = [None] * len(media_files)
+        staged = {}  # input index -> (blob name, kept audio path or None)
+
+        def stage(i, media_file):
+            upload_path, is_temp = self._prepare_batch_upload(media_file)
+            blob_name = f"{prefix}/{i:05d}_{upload_path.name}"
+            with open(upload_path, 'rb') as fh:
+                container.upload_blob(blob_name, fh, overwrite=True, max_concurrency=4)
+            if is_temp and not save_audio:
+                upload_path.unlink(missing_ok=True)
+            return blob_name, upload_path if is_temp and save_audio else None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(stage, i, media_file): i for i, media_file in enumerate(media_files)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    staged[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to upload {media_files[i].name}: {str(e)}")
+                    results[i] = self._error_result(media_files[i], e)
+
+        if not staged:
+            return results
+
+        logger.info(f"Uploaded {len(staged)} files to blob storage")
+        content_urls = {i: container.get_blob_client(blob_name).url for i, (blob_name, _) in staged.items()}
+        transcripts = {}
+        job_error = "No transcript returned by the batch transcription job"
+
+        session = requests.Session()
+        session.headers['Ocp-Apim-Subscription-Key'] = self.azure_key
+        try:
+            response = session.post(self.batch_api_url, json={
+                'contentUrls': list(content_urls.values()),
+                'locale': language,
+                'displayName': f"video_transcription batch {time.strftime('%Y-%m-%d %H:%M:%S')}"
+            }, timeout=self.http_timeout)
+            response.raise_for_status()
+            transcription_url = response.json()['self']
+            logger.info(f"Submitted batch transcription job: {transcription_url}")
+
+            try:
+                job = self._wait_for_batch_job(session, transcription_url)
+                if job['status'] == 'Succeeded':
+                    transcripts = self._fetch_batch_transcripts(session, job)
+                else:
+                    job_error = job.get('properties', {}).get('error', {}).get('message', 'Batch transcription failed')
+            finally:
+                try:
+                    session.delete(transcription_url, timeout=self.http_timeout)
+                except Exception as e:
+                    logger.warning(f"Failed to delete batch transcription job: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Error during batch transcription: {str(e)}")
+            job_error = str(e)
+        finally:
+            session.close()
+            for blob_name, _ in staged.values():
+                try:
+                    container.delete_blob(blob_name)
+                except Exception as e:
+                    logger.warning(f"Failed to delete staged blob {blob_name}: {str(e)}")
+
+        for i, (_, audio_path) in staged.items():
+            media_file = media_files[i]
+            transcript = transcripts.get(unquote(urlsplit(content_urls[i]).path))
+            if transcript is None:
+                logger.error(f"Failed to process {media_file.name}: {job_error}")
+                results[i] = self._error_result(media_file, job_error)
+                continue
+
+            transcription, confidence = transcript
+            results[i] = TranscriptionResult(
+                input_file=str(media_file.absolute()),
+                file_type='video' if media_file.suffix.lower() in self.supported_video_formats else 'audio',
+                file_size_mb=round(media_file.stat().st_size / (1024 * 1024), 2),
+                audio_file=str(audio_path.absolute()) if audio_path else None,
+                transcription=transcription,
+                confidence_score=round(confidence, 4),
+                language=language,
+                processing_time_seconds=round(time.time() - start_time, 2),
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+            )
+            self._save_transcription_file(results[i])
+
+        return results
+
+    def _prepare_batch_upload(self, media_file: Path) -> Tuple[Path, bool]:
+        """
+        Returns the file to upload for the Batch Transcription API and whether it is
+        a temporary conversion. Audio the service reads natively is uploaded as is;
+        video and other audio containers are converted to 16kHz mono WAV.
+        """
+        suffix = media_file.suffix.lower()
+        if suffix in self.batch_api_audio_formats:
+            return media_file, False
+        if suffix in self.supported_video_formats:
+            return Path(self.extract_audio_from_video(str(media_file))), True
+
+        # Unique per call, so files sharing a stem can be staged concurrently
+        wav_path = Path(self.temp_dir) / f"{media_file.stem}_{uuid.uuid4().hex[:8]}_audio.wav"
+        self._run_ffmpeg([
+            'ffmpeg', '-nostdin', '-y', '-loglevel', 'error', '-i', str(media_file),
+            '-vn', *self.WAV_FFMPEG_PARAMS, str(wav_path)
+        ])
+        return wav_path, True
+
+    def _wait_for_batch_job(self, session, transcription_url: str) -> dict:
+        """
+        Polls a batch transcription until it succeeds or fails, backing off between checks.
+        Raises TimeoutError if it hasn't finished within batch_max_wait_seconds.
+        """
+        deadline = time.time() + self.batch_max_wait_seconds
+        delay = 5
+        while True:
+            response = session.get(transcription_url, timeout=self.http_timeout)
+            response.raise_for_status()
+            job = response.json()
+            status = job.get('status')
+            if status in ('Succeeded', 'Failed'):
+                logger.info(f"Batch transcription finished with status: {status}")
+                return job
+
+            if time.time() + delay > deadline:
+                raise TimeoutError(f"Batch transcription still {status} after {self.batch_max_wait_seconds} seconds")
+
+            logger.info(f"Batch transcription status: {status}; checking again in {delay:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 1.5, 60)
+
+    def _fetch_batch_transcripts(self, session, job: dict) -> dict:
+        """
+        Downloads the transcript files of a finished batch job.
+
+        Returns:
+            Mapping of source blob path to (transcription, average confidence)
+        """
+        transcripts = {}
+        files_url = job['links']['files']
+        while files_url:
+            response = session.get(files_url, timeout=self.http_timeout)
+            response.raise_for_status()
+            page = response.json()
+
+            for entry in page.get('values', []):
+                if entry.get('kind') != 'Transcription':
+                    continue
+                # contentUrl is a SAS link to storage; don't send it the Speech key
+                content = session.get(entry['links']['contentUrl'], headers={'Ocp-Apim-Subscription-Key': None},
+                                      timeout=self.http_timeout)
+                content.raise_for_status()
+                data = content.json()
+
+                combined = data.get('combinedRecognizedPhrases', [])
+                transcription = combined[0].get('display', '') if combined else ''
+                confidence_scores = [
+                    phrase['nBest'][0].get('confidence', 0)
+                    for phrase in data.get('recognizedPhrases', []) if phrase.get('nBest')
+                ]
+                avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
+                transcripts[unquote(urlsplit(data.get('source', '')).path)] = (transcription, avg_confidence)
+
+            files_url = page.get('@nextLink')
+        return transcripts
+
     def cleanup(self):
         """Clean up temporary files and directories."""
+        if self._token_timer is not None:
+            self._token_timer.cancel()
         try:
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-                logger.info(f"Cleaned up temporary directory: {self.temp_dir}")
+            shutil.rmtree(self.temp_dir)
+            logger.info(f"Cleaned up temporary directory: {self.temp_dir}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to clean up temporary directory: {str(e)}")
 
 def main():
     """Main function to run the application."""
     load_dotenv()
+
+    # Validate the command line before constructing the app, so usage errors
+    # don't create (and tear down) a temporary directory.
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Single file: python video_transcription_app.py path/to/media.mp4 [language]")
+        print("  Batch mode:  python video_transcription_app.py --batch path/to/directory [language]")
+        print("  Test mode:   python video_transcription_app.py --test path/to/media.mp4 [language]")
+        print("\nSupported languages: en-US, es-ES, fr-FR, de-DE, it-IT, pt-BR, ja-JP, ko-KR, zh-CN, pl-PL, ...")
+        print("\nLanguage selection priority:")
+        print("  1. Command-line argument [language]")
+        print("  2. DEFAULT_LANGUAGE in .env file")
+        print("  3. Fallback: en-US")
+        return
+
+    if sys.argv[1] == '--test' and len(sys.argv) < 3:
+        print("Error: Please specify a file for test processing")
+        return
+
+    if sys.argv[1] == '--batch' and len(sys.argv) < 3:
+        print("Error: Please specify directory for batch processing")
+        return
+
     azure_key = os.getenv('AZURE_SPEECH_KEY')
     azure_region = os.getenv('AZURE_SPEECH_REGION')
 
@@ -442,26 +1324,11 @@ def main():
     app = VideoTranscriptionApp(azure_key, azure_region)
 
     try:
-        if len(sys.argv) < 2:
-            print("Usage:")
-            print("  Single file: python video_transcription_app.py path/to/media.mp4 [language]")
-            print("  Batch mode:  python video_transcription_app.py --batch path/to/directory [language]")
-            print("  Test mode:   python video_transcription_app.py --test path/to/media.mp4 [language]")
-            print("\nSupported languages: en-US, es-ES, fr-FR, de-DE, it-IT, pt-BR, ja-JP, ko-KR, zh-CN, pl-PL, ...")
-            print("\nLanguage selection priority:")
-            print("  1. Command-line argument [language]")
-            print("  2. DEFAULT_LANGUAGE in .env file")
-            print("  3. Fallback: en-US")
-            return
-
         # Read language from CLI, .env, or fallback
         default_language = os.getenv('DEFAULT_LANGUAGE', 'en-US')
 
         # Test mode
         if sys.argv[1] == '--test':
-            if len(sys.argv) < 3:
-                print("Error: Please specify a file for test processing")
-                return
             file_path = sys.argv[2]
             language = sys.argv[3] if len(sys.argv) > 3 else default_language
             print(f"Starting test processing of file: {file_path}")
@@ -469,15 +1336,12 @@ def main():
             logger.info(f"[TEST MODE] Using language: {language}")
             result = app.process_file_test(file_path, language)
             print(f"\nTest transcription completed!")
-            print(f"Processing time: {result['processing_time_seconds']} seconds")
-            print(f"Confidence score: {result['confidence_score']}")
-            print(f"Test transcript saved to: {result['transcript_file']}")
+            print(f"Processing time: {result.processing_time_seconds} seconds")
+            print(f"Confidence score: {result.confidence_score}")
+            print(f"Test transcript saved to: {result.transcript_file}")
 
         # Batch mode
         elif sys.argv[1] == '--batch':
-            if len(sys.argv) < 3:
-                print("Error: Please specify directory for batch processing")
-                return
             directory = sys.argv[2]
             language = sys.argv[3] if len(sys.argv) > 3 else default_language
             print(f"Starting batch processing of directory: {directory}")
@@ -486,8 +1350,8 @@ def main():
             results = app.batch_process(directory, language)
             print(f"\nBatch processing completed!")
             print(f"Processed: {len(results)} files")
-            print(f"Successful: {len([r for r in results if 'error' not in r])}")
-            print(f"Failed: {len([r for r in results if 'error' in r])}")
+            print(f"Successful: {len([r for r in results if r.error is None])}")
+            print(f"Failed: {len([r for r in results if r.error is not None])}")
         
         # Single file mode
         else:
@@ -498,12 +1362,12 @@ def main():
             logger.info(f"[SINGLE FILE MODE] Using language: {language}")
             result = app.process_file(file_path, language, save_audio=True)
             print(f"\nTranscription completed!")
-            print(f"Processing time: {result['processing_time_seconds']} seconds")
-            print(f"Confidence score: {result['confidence_score']}")
-            print(f"Transcript saved to: {result['transcript_file']}")
+            print(f"Processing time: {result.processing_time_seconds} seconds")
+            print(f"Confidence score: {result.confidence_score}")
+            print(f"Transcript saved to: {result.transcript_file}")
             print(f"\nTranscription preview:")
-            preview = result['transcription'][:500]
-            print(f"{preview}{'...' if len(result['transcription']) > 500 else ''}")
+            preview = result.transcription[:500]
+            print(f"{preview}{'...' if len(result.transcription) > 500 else ''}")
     finally:
         app.cleanup()
 